@@ -0,0 +1,13 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep the linter's on-disk caches out of the user cache directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("UMBREL_LINTER_NO_CACHE", raising=False)
+    return tmp_path / "cache" / "umbrel-linter"
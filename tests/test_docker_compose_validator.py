@@ -0,0 +1,104 @@
+"""
+Tests for Docker Compose validation.
+
+This module contains tests for the Docker Compose validator.
+"""
+
+import asyncio
+
+import pytest
+
+from umbrel_linter.core.models import Severity
+from umbrel_linter.validators.docker_compose_validator import DockerComposeValidator
+
+
+def _validate(content, app_id="test-app", files=None):
+    """Run the compose validator synchronously."""
+    validator = DockerComposeValidator()
+    return asyncio.run(validator.validate_docker_compose(content, app_id, files or []))
+
+
+class TestDockerComposeValidator:
+    """Test DockerComposeValidator."""
+
+    def test_missing_restart_policy(self):
+        """Test that services without on-failure restart policy are reported."""
+        content = """
+services:
+  web:
+    user: "1000:1000"
+"""
+        errors = _validate(content)
+        restart_errors = [e for e in errors if e.id == "invalid_restart_policy"]
+
+        assert len(restart_errors) == 1
+        assert restart_errors[0].severity == Severity.WARNING
+        assert restart_errors[0].file == "test-app/docker-compose.yml"
+        assert restart_errors[0].properties_path == "services.web.restart"
+
+    def test_app_proxy_skips_restart_policy(self):
+        """Test that app_proxy is exempt from the restart policy check."""
+        content = """
+services:
+  app_proxy:
+    environment:
+      APP_HOST: test-app_web_1
+      APP_PORT: 8080
+  web:
+    user: "1000:1000"
+    restart: on-failure
+"""
+        errors = _validate(content)
+        assert not [e for e in errors if e.id == "invalid_restart_policy"]
+
+    def test_boolean_environment_value(self):
+        """Test that boolean environment values are reported."""
+        content = """
+services:
+  web:
+    restart: on-failure
+    environment:
+      DEBUG: true
+"""
+        errors = _validate(content)
+        bool_errors = [e for e in errors if e.id == "invalid_yaml_boolean_value"]
+
+        assert len(bool_errors) == 1
+        assert bool_errors[0].properties_path == "services.web.environment.DEBUG"
+        assert '"true" instead of True' in bool_errors[0].message
+
+    def test_docker_socket_mount(self):
+        """Test that mounting the Docker socket is reported once per volume."""
+        content = """
+services:
+  web:
+    restart: on-failure
+    volumes:
+      - /var/run/docker.sock:/var/run/docker.sock
+      - source: /var/run/docker.sock
+        target: /var/run/docker.sock
+"""
+        errors = _validate(content)
+        socket_errors = [e for e in errors if e.id == "docker_socket_mount"]
+
+        assert len(socket_errors) == 2
+        assert all(e.severity == Severity.WARNING for e in socket_errors)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "services: []\n",
+            "services:\n  web: nginx\n",
+            "- web\n",
+            "",
+            "services:\n  aaa:\n    restart: on-failure\n    ports: 5\n  web: nginx\n",
+            "services:\n  aaa:\n    restart: on-failure\n    ports: 5\n  db: [1, 2]\n",
+            "services:\n  'we b': nginx\n",
+        ],
+    )
+    def test_structural_error_skips_content_checks(self, content):
+        """Test that a broken services layout only reports the schema error."""
+        errors = _validate(content)
+
+        assert len(errors) == 1
+        assert errors[0].id == "schema_validation_error"
@@ -0,0 +1,216 @@
+"""
+Tests for Docker image validation.
+
+This module contains tests for parsing Docker image references and for
+caching registry lookups.
+"""
+
+import asyncio
+import json
+import math
+
+import httpx
+import pytest
+
+from umbrel_linter.validators._manifest_cache import ManifestCache
+from umbrel_linter.validators.docker_image_validator import (
+    DockerImage,
+    DockerImageValidator,
+    DockerRegistryClient,
+)
+
+_MULTI_ARCH = [
+    {"os": "linux", "architecture": "amd64", "variant": None},
+    {"os": "linux", "architecture": "arm64", "variant": "v8"},
+]
+_INDEX_RESPONSE = {
+    "headers": {"Content-Type": "application/vnd.oci.image.index.v1+json", "ETag": '"sha256:index"'},
+    "content": json.dumps({"manifests": [
+        {"platform": {"os": "linux", "architecture": "amd64"}},
+        {"platform": {"os": "linux", "architecture": "arm64", "variant": "v8"}},
+    ]}),
+}
+
+
+def _lookup(handler, images, cache):
+    """Look up architectures of images concurrently against a mock registry."""
+    async def run():
+        client = DockerRegistryClient(manifest_cache=cache)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            return await asyncio.gather(
+                *(client.get_architectures(DockerImage.from_string(image)) for image in images)
+            )
+
+    return asyncio.run(run())
+
+
+class TestDockerImage:
+    """Test DockerImage."""
+
+    @pytest.mark.parametrize(
+        "image_string, expected",
+        [
+            ("nginx", ("docker.io", "library/nginx", None, None)),
+            ("nginx:1.25", ("docker.io", "library/nginx", "1.25", None)),
+            ("getumbrel/app:v1", ("docker.io", "getumbrel/app", "v1", None)),
+            ("ghcr.io/org/team/app:1.0", ("ghcr.io", "org/team/app", "1.0", None)),
+            ("localhost:5000/app", ("localhost:5000", "app", None, None)),
+            ("localhost/app:dev", ("localhost", "app", "dev", None)),
+            (
+                "nginx:1.25@sha256:abc123",
+                ("docker.io", "library/nginx", "1.25", "sha256:abc123"),
+            ),
+        ],
+    )
+    def test_from_string(self, image_string, expected):
+        """Test parsing image references into host, path, tag and digest."""
+        image = DockerImage.from_string(image_string)
+
+        assert (image.host, image.path, image.tag, image.digest) == expected
+
+    @pytest.mark.parametrize("image_string", ["", "nginx:", "nginx@a@b", "nginx:1\n"])
+    def test_from_string_invalid(self, image_string):
+        """Test that malformed references are rejected."""
+        with pytest.raises(ValueError):
+            DockerImage.from_string(image_string)
+
+
+class TestDockerImageValidator:
+    """Test DockerImageValidator."""
+
+    def test_malformed_image_skips_registry(self):
+        """Test that images failing the digest format are not looked up."""
+
+        class Registry:
+            async def is_registry(self, host):
+                raise AssertionError("unexpected registry probe")
+
+            async def validate_image(self, image):
+                raise AssertionError("unexpected registry lookup")
+
+        validator = DockerImageValidator()
+        validator.registry_client = Registry()
+        services = {"web": {"image": "nginx:1.25"}}
+
+        errors = asyncio.run(validator.validate_images(services, "test-app", check_architectures=True))
+
+        assert len(errors) == 1
+        assert errors[0].id == "invalid_docker_image_name"
+        assert errors[0].properties_path == "services.web.image"
+
+
+class TestDockerRegistryClient:
+    """Test DockerRegistryClient against a mock registry."""
+
+    def test_index_is_fetched_in_one_request(self, tmp_path):
+        """Test that a cold lookup of a multi-arch image is a single GET."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, **_INDEX_RESPONSE)
+
+        results = _lookup(handler, ["ghcr.io/org/app:1.0"], ManifestCache(tmp_path / "m.sqlite3"))
+
+        assert results == [_MULTI_ARCH]
+        assert [(r.method, r.url.path) for r in requests] == [("GET", "/v2/org/app/manifests/1.0")]
+
+    def test_concurrent_lookups_share_one_request(self, tmp_path):
+        """Test that lookups of the same image in flight are coalesced."""
+        requests = []
+        stored = []
+        cache = ManifestCache(tmp_path / "m.sqlite3")
+        cache_set = cache.set
+        cache.set = lambda key, *args: (stored.append(key), cache_set(key, *args))
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, **_INDEX_RESPONSE)
+
+        results = _lookup(handler, ["ghcr.io/org/app:1.0"] * 3, cache)
+
+        assert results == [_MULTI_ARCH] * 3
+        assert len(requests) == 1
+        assert stored == ["ghcr.io/org/app:1.0"]
+
+    def test_auth_challenge_and_token_reuse(self, tmp_path):
+        """Test the 401 -> token -> retry flow, and reuse of the token."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.host == "auth.example.com":
+                assert request.url.params["scope"] == "repository:org/app:pull"
+                return httpx.Response(200, json={"token": "secret", "expires_in": 300})
+            if request.headers.get("Authorization") != "Bearer secret":
+                return httpx.Response(401, headers={
+                    "WWW-Authenticate": 'Bearer realm="https://auth.example.com/token",service="ghcr.io"',
+                })
+            return httpx.Response(200, **_INDEX_RESPONSE)
+
+        async def run():
+            client = DockerRegistryClient(manifest_cache=ManifestCache(tmp_path / "m.sqlite3"))
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with client:
+                first = await client.get_architectures(DockerImage.from_string("ghcr.io/org/app:1.0"))
+                second = await client.get_architectures(DockerImage.from_string("ghcr.io/org/app:2.0"))
+            return first, second
+
+        assert asyncio.run(run()) == (_MULTI_ARCH, _MULTI_ARCH)
+        # The second tag of the repository goes straight to the manifest
+        assert [(r.url.host, r.url.path) for r in requests] == [
+            ("ghcr.io", "/v2/org/app/manifests/1.0"),
+            ("auth.example.com", "/token"),
+            ("ghcr.io", "/v2/org/app/manifests/1.0"),
+            ("ghcr.io", "/v2/org/app/manifests/2.0"),
+        ]
+
+    def test_expired_entry_is_revalidated(self, tmp_path):
+        """Test that an expired cache entry is confirmed with a 304 to a HEAD."""
+        path = tmp_path / "m.sqlite3"
+        cache = ManifestCache(path)
+        cache.set("ghcr.io/org/app:1.0", 0.0, _MULTI_ARCH, '"sha256:index"')
+        cache.close()
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.headers.get("If-None-Match") == '"sha256:index"':
+                return httpx.Response(304)
+            return httpx.Response(200, **_INDEX_RESPONSE)
+
+        results = _lookup(handler, ["ghcr.io/org/app:1.0"], ManifestCache(path))
+
+        assert results == [_MULTI_ARCH]
+        assert [r.method for r in requests] == ["HEAD"]
+
+
+class TestManifestCache:
+    """Test ManifestCache."""
+
+    def test_persists_across_connections(self, tmp_path):
+        """Test that stored architectures survive reopening the database."""
+        path = tmp_path / "manifests.sqlite3"
+        architectures = [{"os": "linux", "architecture": "arm64"}]
+
+        cache = ManifestCache(path)
+        cache.set("docker.io/library/nginx@sha256:abc", math.inf, architectures)
+        cache.set("docker.io/library/nginx:latest", 0.0, architectures, '"sha256:def"')
+        cache.close()
+
+        cache = ManifestCache(path)
+        assert cache.get("docker.io/library/nginx@sha256:abc") == (architectures, None, True)
+        # Expired entries are returned with their ETag for revalidation
+        assert cache.get("docker.io/library/nginx:latest") == (architectures, '"sha256:def"', False)
+        assert cache.get("docker.io/library/redis:7") is None
+        cache.close()
+
+    def test_unwritable_path_is_ignored(self, tmp_path):
+        """Test that an unusable cache location disables the cache."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = ManifestCache(blocker / "manifests.sqlite3")
+
+        cache.set("key", math.inf, [])
+        assert cache.get("key") is None
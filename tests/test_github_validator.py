@@ -0,0 +1,30 @@
+"""
+Tests for GitHub validation.
+
+This module contains tests for the GitHub URL validator.
+"""
+
+import pytest
+
+from umbrel_linter.validators.github_validator import _norm_key
+
+
+class TestNormKey:
+    """Test GitHub cache key normalization."""
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://github.com/owner/repo",
+            "https://github.com/owner/repo/",
+            "https://www.github.com/owner/repo",
+            "https://GitHub.com/Owner/Repo",
+        ],
+    )
+    def test_equivalent_urls_share_key(self, url):
+        """Test that spellings of the same repository map to one key."""
+        assert _norm_key(url) == "https://github.com/owner/repo"
+
+    def test_pull_request_url_is_distinct(self):
+        """Test that a PR URL does not collide with its repository."""
+        assert _norm_key("https://github.com/owner/repo/pull/1") != _norm_key("https://github.com/owner/repo")
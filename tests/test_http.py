@@ -0,0 +1,48 @@
+"""
+Tests for HTTP utilities.
+
+This module contains tests for the retrying request helper.
+"""
+
+import asyncio
+
+import httpx
+
+from umbrel_linter.utils.http import request_with_retry
+
+
+def _send(statuses):
+    """Send one request against a server answering with the given statuses."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(statuses[len(calls) - 1], headers={"Retry-After": "0"})
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await request_with_retry(client, "GET", "https://example.com/")
+
+    return asyncio.run(run()), len(calls)
+
+
+class TestRequestWithRetry:
+    """Test request_with_retry."""
+
+    def test_success_is_not_retried(self):
+        """Test that a successful response is returned as is."""
+        response, calls = _send([200])
+        assert response.status_code == 200
+        assert calls == 1
+
+    def test_rate_limit_is_retried(self):
+        """Test that a 429 response is retried once."""
+        response, calls = _send([429, 200])
+        assert response.status_code == 200
+        assert calls == 2
+
+    def test_retries_only_once(self):
+        """Test that a persistent failure is returned after one retry."""
+        response, calls = _send([503, 503, 200])
+        assert response.status_code == 503
+        assert calls == 2
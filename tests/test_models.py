@@ -62,6 +62,23 @@ class TestLintingError:
         assert error.line == line_range
         assert error.column == column_range
 
+    def test_linting_error_rejects_unknown_attributes(self):
+        """Test that only declared fields can be assigned on a linting error."""
+        error = LintingError(
+            id="test_error",
+            severity=Severity.ERROR,
+            title="Test Error",
+            message="This is a test error",
+            file="test.yml"
+        )
+
+        # Declared fields stay assignable (validators rewrite file paths)
+        error.file = "app/docker-compose.yml"
+        assert error.file == "app/docker-compose.yml"
+
+        with pytest.raises(ValueError):
+            error.service = "web"
+
 
 class TestLineRange:
     """Test LineRange model."""
@@ -0,0 +1,48 @@
+"""
+Tests for variable mocking.
+
+This module contains tests for mocking environment variables in Docker Compose files.
+"""
+
+from umbrel_linter.validators.variable_mocker import VariableMocker
+
+
+class TestVariableMocker:
+    """Test VariableMocker."""
+
+    def test_mock_plain_and_braced_variables(self):
+        """Test that both $VAR and ${VAR} are replaced."""
+        mocker = VariableMocker()
+        content = "volumes:\n  - ${APP_DATA_DIR}/data:/data\n  - $APP_DATA_DIR/config:/config\n"
+
+        mocked = mocker.mock_variables(content)
+
+        assert "$" not in mocked
+        assert "/path/to/dir/data:/data" in mocked
+        assert "/path/to/dir/config:/config" in mocked
+
+    def test_mock_port_is_numeric(self):
+        """Test that port variables are mocked with a valid port number."""
+        mocker = VariableMocker()
+
+        mocked = mocker.mock_variables("${APP_PORT}")
+
+        assert mocked.isdigit()
+        assert 1024 <= int(mocked) <= 65535
+
+    def test_mock_port_is_reproducible(self):
+        """Test that a port variable gets the same mock on every call."""
+        mocker = VariableMocker()
+        content = "ports:\n  - ${APP_PORT}:80\n"
+
+        assert mocker.mock_variables(content) == mocker.mock_variables(content)
+        assert VariableMocker().mock_variables("$APP_PORT") == mocker.mock_variables("$APP_PORT")
+
+    def test_mock_rule_priority(self):
+        """Test that earlier rules win over fragments appearing earlier in the name."""
+        mocker = VariableMocker()
+
+        # "_IP" has priority over "_PASS" even though "_PASS" comes first
+        assert mocker.mock_variables("$APP_PASS_IP") == "10.10.10.10"
+        assert mocker.mock_variables("$APP_HOST") == "host"
+        assert mocker.mock_variables("$SOMETHING") == "mocked"
@@ -0,0 +1,192 @@
+"""
+Tests for YAML validation.
+
+This module contains tests for the YAML parsing and validation helpers.
+"""
+
+from umbrel_linter.validators import yaml_validator
+from umbrel_linter.validators.yaml_validator import (
+    _load_yaml,
+    _prune_parsed_cache,
+    get_source_map_for_path,
+    lint_yaml,
+    parse_yaml_header,
+    parse_yaml_with_error_handling,
+    validate_boolean_strings,
+    validate_from_content,
+)
+
+
+class TestParseYaml:
+    """Test parse_yaml_with_error_handling."""
+
+    def test_parse_valid_yaml(self):
+        """Test that valid YAML is parsed without an error."""
+        data, error = parse_yaml_with_error_handling("name: app\nport: 8080\n", "umbrel-app.yml")
+
+        assert error is None
+        assert data == {"name": "app", "port": 8080}
+
+    def test_parse_invalid_yaml(self):
+        """Test that a syntax error is reported as a linting error."""
+        data, error = parse_yaml_with_error_handling("name: [app\n", "umbrel-app.yml")
+
+        assert data is None
+        assert error.id == "invalid_yaml_syntax"
+        assert error.file == "umbrel-app.yml"
+
+    def test_parsed_yaml_disk_cache(self, isolated_cache_dir):
+        """Test that parsed YAML is cached on disk only when JSON keeps it intact."""
+        cache_dir = isolated_cache_dir / "parsed-yaml"
+        load = _load_yaml.__wrapped__
+
+        assert load("name: app\nport: 8080\n") == {"name": "app", "port": 8080}
+        assert len(list(cache_dir.iterdir())) == 1
+        # Served from the JSON file the second time
+        assert load("name: app\nport: 8080\n") == {"name": "app", "port": 8080}
+
+        # Dates and integer keys would not survive a JSON round trip
+        load("released: 2024-01-01\n")
+        load("1: one\n")
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_parsed_yaml_disk_cache_limits(self, isolated_cache_dir, monkeypatch):
+        """Test that the disk cache is pruned to its limit and can be disabled."""
+        cache_dir = isolated_cache_dir / "parsed-yaml"
+        load = _load_yaml.__wrapped__
+        monkeypatch.setattr(yaml_validator, "_PARSED_CACHE_MAX_FILES", 2)
+        for i in range(3):
+            load(f"id: {i}\n")
+        _prune_parsed_cache.cache_clear()
+        load("id: 3\n")
+
+        # Pruned to the limit before the new file was added
+        assert len(list(cache_dir.iterdir())) == 3
+
+        monkeypatch.setenv("UMBREL_LINTER_NO_CACHE", "1")
+        assert load("id: 4\n") == {"id": 4}
+        assert len(list(cache_dir.iterdir())) == 3
+
+
+class TestParseYamlHeader:
+    """Test parse_yaml_header."""
+
+    content = "id: app\nname: App\ndescription: >-\n" + "  lorem ipsum\n" * 500 + "port: 8080\n"
+
+    def test_header_keys_only(self):
+        """Test that keys in the header are parsed without the rest of the file."""
+        data = parse_yaml_header(self.content, required_fields=("id", "name"))
+
+        assert data == {"id": "app", "name": "App"}
+
+    def test_missing_required_field_parses_everything(self):
+        """Test that a required key beyond the header triggers a full parse."""
+        data = parse_yaml_header(self.content, required_fields=("id", "port"))
+
+        assert data["port"] == 8080
+        assert data["description"].startswith("lorem ipsum")
+
+
+class TestGetSourceMapForPath:
+    """Test get_source_map_for_path."""
+
+    content = "services:\n  web:\n    image: web\n  db:\n    image: db\n    ports:\n      - 80:80\n"
+
+    def test_nested_key(self):
+        """Test that the key is located even when its name appears earlier."""
+        source_map = get_source_map_for_path(self.content, ["services", "db", "image"])
+
+        assert source_map["line"].start == 5
+        assert source_map["column"].start == 5
+
+    def test_sequence_item(self):
+        """Test that list indexes in the path are resolved."""
+        source_map = get_source_map_for_path(self.content, ["services", "db", "ports", "0"])
+
+        assert source_map["line"].start == 7
+        assert source_map["column"].start == 9
+
+    def test_missing_path(self):
+        """Test that a path not in the document has no source map."""
+        assert get_source_map_for_path(self.content, ["services", "cache"]) == {}
+
+    def test_invalid_yaml_falls_back_to_line_search(self):
+        """Test that unparsable content is searched line by line."""
+        source_map = get_source_map_for_path("name: app\nport: [\n", ["port"])
+
+        assert source_map["line"].start == 2
+
+
+class TestValidateBooleanStrings:
+    """Test validate_boolean_strings."""
+
+    def test_paths_in_document_order(self):
+        """Test that nested booleans are reported with their paths, in order."""
+        data = {
+            "services": {
+                "web": {"environment": {"DEBUG": True}},
+                "db": {"healthcheck": [{"disable": False}, "text"]},
+            },
+            "enabled": True,
+        }
+
+        errors = validate_boolean_strings(data, "docker-compose.yml")
+
+        assert [e.properties_path for e in errors] == [
+            "services.web.environment.DEBUG",
+            "services.db.healthcheck[0].disable",
+            "enabled",
+        ]
+        assert errors[0].message == "Boolean values should be strings like 'true' instead of True"
+
+    def test_deeply_nested_data(self):
+        """Test that nesting deeper than the recursion limit is handled."""
+        data = node = {}
+        for _ in range(5000):
+            node["child"] = {}
+            node = node["child"]
+        node["flag"] = True
+
+        errors = validate_boolean_strings(data, "docker-compose.yml")
+
+        assert len(errors) == 1
+        assert errors[0].properties_path.endswith("child.flag")
+
+
+class TestLintYaml:
+    """Test lint_yaml."""
+
+    def test_all_checks_in_one_call(self):
+        """Test that structure, type and boolean errors are all reported."""
+        content = "name: 1\nenabled: true\n"
+
+        data, errors = lint_yaml(content, ["id", "name"], {"name": str}, "umbrel-app.yml")
+
+        assert data == {"name": 1, "enabled": True}
+        assert [e.id for e in errors] == [
+            "missing_required_field",
+            "invalid_type",
+            "invalid_yaml_boolean_value",
+        ]
+
+    def test_syntax_error(self):
+        """Test that a syntax error is the only error reported."""
+        data, errors = lint_yaml("name: [\n", ["id"], {}, "umbrel-app.yml")
+
+        assert data is None
+        assert [e.id for e in errors] == ["invalid_yaml_syntax"]
+
+
+class TestValidateFromContent:
+    """Test validate_from_content."""
+
+    def test_cached_errors_are_not_shared(self):
+        """Test that repeated calls return equal but independent errors."""
+        content = "name: app\nenabled: true\n"
+
+        first = validate_from_content(content, ["id"], {}, "umbrel-app.yml")
+        first[0].file = "other.yml"
+        second = validate_from_content(content, ["id"], {}, "umbrel-app.yml")
+
+        assert [e.id for e in second] == ["missing_required_field", "invalid_yaml_boolean_value"]
+        assert second[0].file == "umbrel-app.yml"
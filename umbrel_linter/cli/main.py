@@ -16,7 +16,13 @@ from rich.table import Table
 from rich.text import Text
 
 from ..core.linter import UmbrelLinter
-from ..core.models import AppStoreType, LinterConfig, LintingContext, Severity
+from ..core.models import (
+    AppStoreType,
+    LinterConfig,
+    LintingContext,
+    LintingResult,
+    Severity,
+)
 from .fixer import apply_fixes
 
 # Initialize CLI app
@@ -123,10 +129,9 @@ def lint(
 
         if app_id:
             console.print(f"[blue]Linting app:[/blue] {app_id}")
-            result = asyncio.run(linter.lint_app(directory, app_id, context))
         else:
             console.print(f"[blue]Linting directory:[/blue] {directory}")
-            result = asyncio.run(linter.lint_all_apps(directory, context))
+        result = asyncio.run(_run_lint(linter, directory, app_id, context))
 
         # Display results
         if output_format == "json":
@@ -174,6 +179,19 @@ def lint(
         raise typer.Exit(1)
 
 
+async def _run_lint(
+    linter: UmbrelLinter,
+    directory: Path,
+    app_id: str | None,
+    context: LintingContext,
+) -> LintingResult:
+    """Run the linter and close its HTTP clients afterwards."""
+    async with linter:
+        if app_id:
+            return await linter.lint_app(directory, app_id, context)
+        return await linter.lint_all_apps(directory, context)
+
+
 def _display_rich_output(result, severity: Severity, verbose: bool) -> None:
     """Display results using rich formatting."""
 
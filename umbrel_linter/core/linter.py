@@ -7,7 +7,9 @@ all linting operations for Umbrel applications and app stores.
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
+from typing import Any
 
 from ..schemas.umbrel_app import UmbrelAppManifest, UmbrelAppStoreManifest
 from ..utils.filesystem import file_exists, get_directory_files
@@ -45,6 +47,22 @@ class UmbrelLinter:
         self.config = config or LinterConfig()
         self.docker_compose_validator = DockerComposeValidator()
         self.github_validator = GitHubValidator()
+        # Manifests -> (id, name, port) of each, so the manifests shared by
+        # every app in a run are parsed only once
+        self._manifest_ports: tuple[tuple[str, ...], list[tuple[Any, Any, Any]]] | None = None
+
+    async def __aenter__(self) -> UmbrelLinter:
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close network resources on exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients shared by the validators."""
+        await self.docker_compose_validator.aclose()
+        await self.github_validator.aclose()
 
     def lint_app_store(self, directory: Path, context: LintingContext | None = None) -> LintingResult:
         """
@@ -177,9 +195,11 @@ class UmbrelLinter:
                 if (item / "umbrel-app.yml").exists():
                     app_directories.append(item.name)
 
-        # Lint each app
-        for app_id in app_directories:
-            app_result = await self.lint_app(directory, app_id, context)
+        # Lint each app concurrently
+        app_results = await asyncio.gather(
+            *(self.lint_app(directory, app_id, context) for app_id in app_directories),
+        )
+        for app_result in app_results:
             result.errors.extend(app_result.errors)
             result.success = result.success and app_result.success
 
@@ -451,20 +471,32 @@ class UmbrelLinter:
         """Get used ports from all app manifests."""
         used_ports = {}
 
-        for manifest_content in all_manifests:
-            data, _ = parse_yaml_with_error_handling(manifest_content, "manifest")
-            if data and isinstance(data, dict):
-                app_id = data.get("id")
-                name = data.get("name")
-                port = data.get("port")
-
-                if app_id and name and port and app_id != current_app_id:
-                    # Ensure port is an integer
-                    try:
-                        port_int = int(port)
-                        used_ports[port_int] = f"{name} ({app_id})"
-                    except (ValueError, TypeError):
-                        # Skip invalid port values
-                        continue
+        manifests = tuple(all_manifests)
+        if self._manifest_ports is None or self._manifest_ports[0] != manifests:
+            # Only the small top-level header of each manifest is parsed
+            parsed = [
+                parse_yaml_with_error_handling(
+                    content,
+                    "manifest",
+                    top_level_only=True,
+                    required_fields=("id", "name", "port"),
+                )[0]
+                for content in manifests
+            ]
+            self._manifest_ports = (manifests, [
+                (data.get("id"), data.get("name"), data.get("port"))
+                for data in parsed
+                if data and isinstance(data, dict)
+            ])
+
+        for app_id, name, port in self._manifest_ports[1]:
+            if app_id and name and port and app_id != current_app_id:
+                # Ensure port is an integer
+                try:
+                    port_int = int(port)
+                    used_ports[port_int] = f"{name} ({app_id})"
+                except (ValueError, TypeError):
+                    # Skip invalid port values
+                    continue
 
         return used_ports
@@ -7,6 +7,7 @@ used by the linter.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from ..core.models import FileEntry
@@ -184,3 +185,24 @@ def get_relative_path(file_path: Path, base_path: Path) -> str:
         return str(file_path.relative_to(base_path))
     except ValueError:
         return str(file_path)
+
+
+def cache_dir() -> Path:
+    """
+    Get the linter's directory in the user cache directory.
+    
+    Returns:
+        $XDG_CACHE_HOME/umbrel-linter, or ~/.cache/umbrel-linter
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "umbrel-linter"
+
+
+def disk_cache_enabled() -> bool:
+    """
+    Check if results may be cached on disk across linter runs.
+    
+    Returns:
+        False if UMBREL_LINTER_NO_CACHE is set to a non-empty value
+    """
+    return not os.environ.get("UMBREL_LINTER_NO_CACHE")
@@ -0,0 +1,66 @@
+"""
+HTTP utilities.
+
+This module provides helpers shared by the validators that talk to
+remote services (Docker registries, GitHub).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from typing import Any
+
+import httpx
+
+# Statuses worth retrying: rate limiting and transient gateway/server errors
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Upper bound on the wait before a retry, whatever Retry-After asks for
+_MAX_RETRY_DELAY = 5.0
+
+
+def _retry_delay(response: httpx.Response | None) -> float:
+    """Get how long to wait before retrying, in seconds."""
+    if response is not None:
+        try:
+            return min(max(float(response.headers["Retry-After"]), 0.0), _MAX_RETRY_DELAY)
+        except (KeyError, ValueError):
+            # Missing, or an HTTP date, which is not worth parsing here
+            pass
+    # Jitter so parallel requests that failed together do not retry together
+    return random.uniform(0.5, 1.0)
+
+
+async def request_with_retry(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    **kwargs: Any,
+) -> httpx.Response:
+    """
+    Send a request, retrying once on rate limiting or a transient failure.
+
+    Args:
+        client: HTTP client to send the request with
+        method: HTTP method
+        url: Request URL
+        **kwargs: Extra arguments for ``client.request``
+
+    Returns:
+        Response of the last attempt
+
+    Raises:
+        httpx.TransportError: If the retry also fails at the transport level
+    """
+    failed: httpx.Response | None = None
+    try:
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in RETRY_STATUSES:
+            return response
+        failed = response
+    except httpx.TransportError:
+        pass
+
+    await asyncio.sleep(_retry_delay(failed))
+    return await client.request(method, url, **kwargs)
@@ -0,0 +1,125 @@
+"""
+Persistent cache for Docker image manifest lookups.
+
+Architectures of registry images are stored in a small SQLite database in
+the user cache directory, so repeated linter runs (e.g. in CI) do not have
+to query registries again for images that have not changed.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from ..utils.filesystem import cache_dir, disk_cache_enabled
+
+# Bump when the table layout changes; older cache files are then recreated
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS manifests (
+    key TEXT PRIMARY KEY,
+    inserted REAL NOT NULL,
+    ttl REAL NOT NULL,
+    arches TEXT NOT NULL,
+    etag TEXT
+)
+"""
+
+
+def default_cache_path() -> Path:
+    """Get the default location of the manifest cache database."""
+    return cache_dir() / "manifests.sqlite3"
+
+
+class ManifestCache:
+    """On-disk cache of image architectures, keyed by image reference.
+
+    The cache is best effort: if the database cannot be opened or written,
+    lookups miss and stores are dropped instead of failing the lint run.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        """Initialize the cache; the database is opened on first use."""
+        self.path = Path(path) if path is not None else default_cache_path()
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Get the shared connection, opening the database on first use."""
+        if self._conn is None and not self._disabled:
+            if not disk_cache_enabled():
+                self._disabled = True
+                return None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+                # WAL lets parallel linter runs read while another one writes
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS manifests")
+                    conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+                conn.execute(_SCHEMA)
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._disabled = True
+        return self._conn
+
+    def get(self, key: str) -> tuple[list[dict[str, str]], str | None, bool] | None:
+        """Get the cached entry for a key.
+
+        Expired entries are still returned so that callers can revalidate
+        them with their ETag instead of fetching the manifest again.
+
+        Args:
+            key: Image cache key
+
+        Returns:
+            (architectures, etag, fresh) tuple, or None on a miss
+        """
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT arches, etag, inserted + ttl > ? FROM manifests WHERE key = ?",
+                (time.time(), key),
+            ).fetchone()
+            return (json.loads(row[0]), row[1], bool(row[2])) if row else None
+        except (sqlite3.Error, ValueError):
+            return None
+
+    def set(
+        self,
+        key: str,
+        ttl: float,
+        architectures: list[dict[str, str]],
+        etag: str | None = None,
+    ) -> None:
+        """Store architectures for a key.
+
+        Args:
+            key: Image cache key
+            ttl: Lifetime of the entry in seconds (may be infinite)
+            architectures: Architectures to cache
+            etag: ETag of the manifest the architectures were read from
+        """
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO manifests (key, inserted, ttl, arches, etag) VALUES (?, ?, ?, ?, ?)",
+                (key, time.time(), ttl, json.dumps(architectures), etag),
+            )
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
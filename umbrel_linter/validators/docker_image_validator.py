@@ -7,12 +7,58 @@ including registry API calls and architecture checking.
 
 from __future__ import annotations
 
+import asyncio
+import math
 import re
+import time
 from typing import Any
 import httpx
 from urllib.parse import urlparse
 
 from ..core.models import LintingError, Severity
+from ..utils.http import request_with_retry
+from ._manifest_cache import ManifestCache
+
+# Image reference: [host/]path[:tag][@digest]. The first path component is a
+# registry host if it contains a "." or a port, or is "localhost".
+_IMAGE_REF_RE = re.compile(
+    r"(?:(?P<host>[^/\s]+\.[^/\s]+|[^/\s]+:\d+|localhost)/)?"
+    r"(?P<path>[^:@\s]+)"
+    r"(?::(?P<tag>[^@\s]+))?"
+    r"(?:@(?P<digest>[^@\s]+))?"
+)
+
+# Pinned image reference: <name>:<tag>@sha256:<64-hex>
+_DIGEST_RE = re.compile(r"^[a-zA-Z0-9./:_-]+:[^@]+@sha256:[0-9a-fA-F]{64}$")
+
+# auth-param of a WWW-Authenticate challenge (RFC 7235): key=token or key="quoted"
+_AUTH_PARAM_RE = re.compile(r'([A-Za-z0-9_.-]+)\s*=\s*(?:"((?:[^"\\]|\\.)*)"|([^\s,]+))')
+_QUOTED_PAIR_RE = re.compile(r"\\(.)")
+
+# Manifest media types, see the OCI image spec and Docker Registry HTTP API V2
+_INDEX_MEDIA_TYPES = frozenset({
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+})
+_MANIFEST_MEDIA_TYPES = frozenset({
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+    "application/vnd.docker.distribution.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v1+prettyjws",
+})
+_MANIFEST_ACCEPT = (
+    "application/vnd.oci.image.manifest.v1+json, "
+    "application/vnd.oci.image.index.v1+json, "
+    "application/vnd.docker.distribution.manifest.v2+json, "
+    "application/vnd.docker.distribution.manifest.list.v2+json"
+)
+
+# Cache lifetimes (seconds) for architectures of images referenced by tag
+_LATEST_TAG_TTL = 3600.0
+_PINNED_TAG_TTL = 86400.0
+
+# Token lifetime (seconds) assumed when the token service sends no expires_in
+_DEFAULT_TOKEN_TTL = 60.0
 
 
 class DockerImage:
@@ -36,40 +82,16 @@ class DockerImage:
         # - nginx:latest@sha256:abc123
         # - registry.example.com/myapp:1.0.0@sha256:abc123
         
-        # Check for digest
-        if "@" in image_string:
-            image_part, digest = image_string.rsplit("@", 1)
-        else:
-            image_part = image_string
-            digest = None
+        match = _IMAGE_REF_RE.fullmatch(image_string)
+        if not match:
+            raise ValueError(f'Invalid image reference "{image_string}"')
         
-        # Check for tag
-        if ":" in image_part:
-            name_part, tag = image_part.rsplit(":", 1)
-        else:
-            name_part = image_part
-            tag = None
-        
-        # Parse registry and path
-        parts = name_part.split("/")
-        if len(parts) == 1:
-            # Single name like "nginx" -> docker.io/library/nginx
+        host, path, tag, digest = match.group("host", "path", "tag", "digest")
+        if host is None:
+            # Docker Hub image, e.g. "nginx" -> docker.io/library/nginx
             host = "docker.io"
-            path = f"library/{parts[0]}"
-        elif len(parts) == 2:
-            # Two parts like "nginx/nginx" or "registry.com/app"
-            if "." in parts[0] or ":" in parts[0]:
-                # First part looks like a registry
-                host = parts[0]
-                path = parts[1]
-            else:
-                # Two-part namespace
-                host = "docker.io"
-                path = "/".join(parts)
-        else:
-            # Multiple parts like "registry.com/namespace/app"
-            host = parts[0]
-            path = "/".join(parts[1:])
+            if "/" not in path:
+                path = f"library/{path}"
         
         return cls(host=host, path=path, tag=tag, digest=digest)
     
@@ -99,10 +121,49 @@ class DockerImage:
 class DockerRegistryClient:
     """Client for Docker registry API calls."""
     
-    def __init__(self, timeout: float = 1.0):
+    def __init__(self, timeout: float = 1.0, manifest_cache: ManifestCache | None = None):
         """Initialize the registry client."""
         self.timeout = timeout
+        # Persists architectures across runs; in-memory entries sit in front of it
+        self.manifest_cache = manifest_cache if manifest_cache is not None else ManifestCache()
         self._cache: dict[str, bool] = {}
+        self._client: httpx.AsyncClient | None = None
+        # Cache key -> (monotonic fetch time, architectures, manifest ETag)
+        self._arch_cache: dict[str, tuple[float, list[dict[str, str]], str | None]] = {}
+        # Registry host -> realm/service of its token auth challenge
+        self._auth_params: dict[str, dict[str, str]] = {}
+        # (realm, service, scope) -> (monotonic expiry time, bearer token)
+        self._token_cache: dict[tuple[str, str, str], tuple[float, str]] = {}
+        # Cache key -> pending (architectures, ETag) lookup
+        self._inflight: dict[str, asyncio.Future[list[dict[str, str]]]] = {}
+    
+    async def __aenter__(self) -> DockerRegistryClient:
+        """Enter the async context manager."""
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the shared HTTP client on exit."""
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        # Reusing one client keeps TCP/TLS connections to each registry alive;
+        # with HTTP/2, concurrent requests to a registry share one connection
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(connect=2.0, read=self.timeout, write=2.0, pool=5.0),
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=16, max_connections=32, keepalive_expiry=30),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the manifest cache."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.manifest_cache.close()
     
     async def is_registry(self, host: str) -> bool:
         """Check if a host is a valid Docker registry."""
@@ -115,78 +176,140 @@ class DockerRegistryClient:
             return True
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(f"https://{host}/v2/")
-                # Per Docker Registry HTTP API V2 spec, registries may return 200 (OK)
-                # or 401 (Unauthorized) for /v2/ endpoint, while still being valid.
-                is_registry = False
-                if response.status_code in (200, 401):
-                    is_registry = True
-                # Some registries set explicit header
-                if response.headers.get("Docker-Distribution-Api-Version") == "registry/2.0":
-                    is_registry = True
-                self._cache[host] = is_registry
-                return is_registry
+            client = self._get_client()
+            response = await request_with_retry(client, "GET", f"https://{host}/v2/")
+            # Per Docker Registry HTTP API V2 spec, registries may return 200 (OK)
+            # or 401 (Unauthorized) for /v2/ endpoint, while still being valid.
+            is_registry = False
+            if response.status_code in (200, 401):
+                is_registry = True
+            # Some registries set explicit header
+            if response.headers.get("Docker-Distribution-Api-Version") == "registry/2.0":
+                is_registry = True
+            self._cache[host] = is_registry
+            return is_registry
         except Exception:
             self._cache[host] = False
             return False
     
     async def get_architectures(self, image: DockerImage) -> list[dict[str, str]]:
         """Get supported architectures for a Docker image."""
+        key = self._arch_cache_key(image)
+        ttl = self._arch_cache_ttl(image)
+        cached = self._arch_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        # Expired entries are kept so the registry can confirm them with a 304
+        stale = cached[1:] if cached is not None else None
+        entry = self.manifest_cache.get(key)
+        if entry is not None:
+            architectures, etag, fresh = entry
+            if fresh:
+                self._arch_cache[key] = (time.monotonic(), architectures, etag)
+                return architectures
+            stale = (architectures, etag)
+        
+        # Concurrent lookups of the same image share one in-flight request
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(image, key, ttl, stale))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so a cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+    
+    async def _fetch_and_cache(
+        self,
+        image: DockerImage,
+        key: str,
+        ttl: float,
+        stale: tuple[list[dict[str, str]], str | None] | None,
+    ) -> list[dict[str, str]]:
+        """Fetch architectures and store them in both caches, once per fetch."""
+        architectures, etag = await self._fetch_architectures(image, stale)
+        self._arch_cache[key] = (time.monotonic(), architectures, etag)
+        self.manifest_cache.set(key, ttl, architectures, etag)
+        return architectures
+    
+    @staticmethod
+    def _arch_cache_key(image: DockerImage) -> str:
+        """Build the architecture cache key for an image."""
+        if image.digest:
+            return f"{image.api_host}/{image.api_path}@{image.digest}"
+        return f"{image.api_host}/{image.api_path}:{image.tag or 'latest'}"
+    
+    @staticmethod
+    def _arch_cache_ttl(image: DockerImage) -> float:
+        """Get how long architectures of an image may be cached, in seconds."""
+        # Digests are immutable; "latest" moves more often than version tags
+        if image.digest:
+            return math.inf
+        if image.tag in (None, "latest"):
+            return _LATEST_TAG_TTL
+        return _PINNED_TAG_TTL
+    
+    async def _fetch_architectures(
+        self,
+        image: DockerImage,
+        stale: tuple[list[dict[str, str]], str | None] | None = None,
+    ) -> tuple[list[dict[str, str]], str | None]:
+        """Fetch supported architectures and the manifest ETag for a Docker image.
+        
+        Args:
+            image: Image to look up
+            stale: Expired (architectures, ETag) cache entry to revalidate
+            
+        Returns:
+            (architectures, ETag) tuple
+        """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                # Get manifest
-                ref = image.digest or image.tag or "latest"
-                manifest_url = f"https://{image.api_host}/v2/{image.api_path}/manifests/{ref}"
-                accept = (
-                    "application/vnd.oci.image.manifest.v1+json, "
-                    "application/vnd.oci.image.index.v1+json, "
-                    "application/vnd.docker.distribution.manifest.v2+json, "
-                    "application/vnd.docker.distribution.manifest.list.v2+json"
-                )
-                headers = {"Accept": accept}
-
-                response = await client.get(manifest_url, headers=headers)
-
-                # Handle auth challenge (e.g., ghcr.io returns 401 with WWW-Authenticate)
-                if response.status_code == 401:
-                    www_auth = response.headers.get("WWW-Authenticate", "")
-                    params = self._parse_www_authenticate(www_auth)
-                    realm = params.get("realm")
-                    if realm:
-                        # scope: repository:<name>:pull
-                        scope = params.get("scope") or f"repository:{image.api_path}:pull"
-                        service = params.get("service")
-                        token_params = {"scope": scope}
-                        if service:
-                            token_params["service"] = service
-                        token_resp = await client.get(realm, params=token_params, headers={"Accept": "application/json"})
-                        if token_resp.status_code == 200:
-                            token = token_resp.json().get("token") or token_resp.json().get("access_token")
-                            if token:
-                                headers["Authorization"] = f"Bearer {token}"
-                                response = await client.get(manifest_url, headers=headers)
-
-                response.raise_for_status()
-
-                manifest = response.json()
-                content_type = response.headers.get("Content-Type", "")
-
-                # Parse architectures based on manifest type
-                if "manifest.list" in content_type or "image.index" in content_type or manifest.get("manifests"):
-                    # Multi-arch manifest
-                    architectures = []
-                    for manifest_ref in manifest.get("manifests", []):
-                        platform = manifest_ref.get("platform", {})
-                        architectures.append({
-                            "os": platform.get("os", "linux"),
-                            "architecture": platform.get("architecture", "amd64"),
-                            "variant": platform.get("variant")
-                        })
-                    return architectures
-                else:
-                    # Single-arch manifest
-                    return [{"os": "linux", "architecture": "amd64"}]
+            client = self._get_client()
+            ref = image.digest or image.tag or "latest"
+            manifest_url = f"https://{image.api_host}/v2/{image.api_path}/manifests/{ref}"
+            headers = {"Accept": _MANIFEST_ACCEPT}
+
+            if stale is not None and stale[1]:
+                # Revalidate with a bodiless HEAD, which Docker Hub does not
+                # count against its pull rate limit
+                headers["If-None-Match"] = stale[1]
+                response = await self._request_manifest(client, "HEAD", manifest_url, image, headers)
+                headers.pop("If-None-Match")
+                if response.status_code == 304:
+                    # Manifest unchanged since it was cached
+                    return stale
+
+            # Umbrel images are multi-arch, so the registry almost always
+            # answers with a small image index: fetch it in a single request
+            response = await self._request_manifest(client, "GET", manifest_url, image, headers)
+            response.raise_for_status()
+
+            etag = self._manifest_etag(response)
+            media_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+
+            # A single-arch manifest is identified by its media type alone,
+            # so its body (layers, config) never needs to be decoded
+            if media_type in _MANIFEST_MEDIA_TYPES:
+                return [{"os": "linux", "architecture": "amd64"}], etag
+
+            manifest = response.json()
+
+            # Parse architectures based on manifest type
+            if media_type in _INDEX_MEDIA_TYPES or manifest.get("manifests"):
+                # Multi-arch manifest: only the platform of each entry is needed
+                platforms = [entry.get("platform") or {} for entry in manifest.get("manifests", [])]
+                return [
+                    {
+                        "os": platform.get("os", "linux"),
+                        "architecture": platform.get("architecture", "amd64"),
+                        "variant": platform.get("variant"),
+                    }
+                    for platform in platforms
+                ], etag
+            else:
+                # Single-arch manifest
+                return [{"os": "linux", "architecture": "amd64"}], etag
 
         except httpx.HTTPStatusError as e:
             # Propagate status code info up
@@ -194,20 +317,98 @@ class DockerRegistryClient:
         except Exception as e:
             raise Exception(f"Failed to get architectures for {image}: {e}")
 
-    def _parse_www_authenticate(self, header: str) -> dict:
-        params: dict[str, str] = {}
-        if not header:
-            return params
-        # Format: Bearer realm="...",service="...",scope="..."
+    @staticmethod
+    def _manifest_etag(response: httpx.Response) -> str | None:
+        """Get the validator to send as If-None-Match for a manifest response."""
+        # Registries that omit ETag still identify the manifest by its digest
+        etag = response.headers.get("ETag")
+        if etag:
+            return str(etag)
+        digest = response.headers.get("Docker-Content-Digest")
+        return f'"{digest}"' if digest else None
+
+    async def _request_manifest(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        image: DockerImage,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Request a manifest, answering a registry auth challenge if needed."""
+        # Reuse a still valid token for this repository to skip the 401 round trip
+        if "Authorization" not in headers:
+            params = self._auth_params.get(image.api_host)
+            if params is not None:
+                token = self._get_cached_token(params, f"repository:{image.api_path}:pull")
+                if token:
+                    headers["Authorization"] = f"Bearer {token}"
+
+        response = await request_with_retry(client, method, url, headers=headers)
+
+        # Handle auth challenge (e.g., ghcr.io returns 401 with WWW-Authenticate)
+        if response.status_code == 401:
+            # realm and service are stable per registry, so parse them only once
+            params = self._auth_params.get(image.api_host)
+            if params is None:
+                www_auth = response.headers.get("WWW-Authenticate", "")
+                params = self._parse_www_authenticate(www_auth)
+                if params.get("realm"):
+                    self._auth_params[image.api_host] = {
+                        k: v for k, v in params.items() if k in ("realm", "service")
+                    }
+            if params.get("realm"):
+                # scope: repository:<name>:pull
+                scope = params.get("scope") or f"repository:{image.api_path}:pull"
+                token = await self._fetch_token(client, params, scope)
+                if token:
+                    # Later requests for this manifest reuse the same headers
+                    headers["Authorization"] = f"Bearer {token}"
+                    response = await request_with_retry(client, method, url, headers=headers)
+
+        return response
+
+    def _get_cached_token(self, params: dict[str, str], scope: str) -> str | None:
+        """Get a cached, unexpired bearer token for a scope."""
+        cached = self._token_cache.get((params["realm"], params.get("service") or "", scope))
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    async def _fetch_token(self, client: httpx.AsyncClient, params: dict[str, str], scope: str) -> str | None:
+        """Request an anonymous pull token from the registry's token service."""
+        realm = params["realm"]
+        service = params.get("service")
+        token_params = {"scope": scope}
+        if service:
+            token_params["service"] = service
+        token_resp = await request_with_retry(
+            client, "GET", realm, params=token_params, headers={"Accept": "application/json"}
+        )
+        if token_resp.status_code != 200:
+            return None
+
+        body = token_resp.json()
+        token = body.get("token") or body.get("access_token")
+        if not token or not isinstance(token, str):
+            return None
+
         try:
-            parts = header.split(" ", 1)
-            if len(parts) == 2:
-                for item in parts[1].split(","):
-                    if "=" in item:
-                        k, v = item.split("=", 1)
-                        params[k.strip()] = v.strip().strip('"')
-        except Exception:
-            pass
+            expires_in = float(body.get("expires_in", _DEFAULT_TOKEN_TTL))
+        except (TypeError, ValueError):
+            expires_in = _DEFAULT_TOKEN_TTL
+        self._token_cache[(realm, service or "", scope)] = (time.monotonic() + expires_in, token)
+        return token
+
+    def _parse_www_authenticate(self, header: str) -> dict[str, str]:
+        """Parse the parameters of a WWW-Authenticate challenge."""
+        # Format: Bearer realm="...",service="...",scope="..."
+        # Quoted values may contain commas (e.g. scope="repository:a/b:pull,push")
+        _, _, challenge = header.partition(" ")
+        params: dict[str, str] = {}
+        for match in _AUTH_PARAM_RE.finditer(challenge):
+            key, quoted, token = match.groups()
+            params[key.lower()] = _QUOTED_PAIR_RE.sub(r"\1", quoted) if quoted is not None else token
         return params
     
     async def validate_image(self, image: DockerImage) -> list[LintingError]:
@@ -230,15 +431,18 @@ class DockerRegistryClient:
             # Get architectures
             architectures = await self.get_architectures(image)
             
-            # Check if it supports both arm64 and amd64
-            has_arm64 = any(
-                arch.get("os") == "linux" and arch.get("architecture") == "arm64"
-                for arch in architectures
-            )
-            has_amd64 = any(
-                arch.get("os") == "linux" and arch.get("architecture") == "amd64"
-                for arch in architectures
-            )
+            # Check if it supports both arm64 and amd64 (single pass, stops early)
+            has_arm64 = has_amd64 = False
+            for arch in architectures:
+                if arch.get("os") != "linux":
+                    continue
+                architecture = arch.get("architecture")
+                if architecture == "arm64":
+                    has_arm64 = True
+                elif architecture == "amd64":
+                    has_amd64 = True
+                if has_arm64 and has_amd64:
+                    break
             
             if not (has_arm64 and has_amd64):
                 errors.append(LintingError(
@@ -282,9 +486,24 @@ class DockerImageValidator:
         """Initialize the validator."""
         self.registry_client = DockerRegistryClient()
     
+    async def __aenter__(self) -> DockerImageValidator:
+        """Enter the async context manager."""
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close network resources on exit."""
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the registry client."""
+        await self.registry_client.aclose()
+    
     async def validate_images(self, services: dict[str, Any], app_id: str, check_architectures: bool = False) -> list[LintingError]:
         """Validate Docker images in services."""
         errors = []
+        compose_path = f"{app_id}/docker-compose.yml"
+        # (service_name, image_string, image) tuples awaiting registry checks
+        pending: list[tuple[str, str, DockerImage]] = []
         
         for service_name, service_config in services.items():
             image_string = service_config.get("image")
@@ -300,20 +519,21 @@ class DockerImageValidator:
                     severity=Severity.ERROR,
                     title=f'Invalid image name "{image_string}"',
                     message=str(e),
-                    file=f"{app_id}/docker-compose.yml",
+                    file=compose_path,
                     properties_path=f"services.{service_name}.image"
                 ))
                 continue
             
             # Enforce image format with immutable digest: <name>:<tag>@sha256:<64-hex>
             # This avoids mutable tags and ensures reproducible pulls.
-            if not re.match(r"^[a-zA-Z0-9./:_-]+:[^@]+@sha256:[0-9a-fA-F]{64}$", image_string):
+            format_ok = _DIGEST_RE.match(image_string) is not None
+            if not format_ok:
                 errors.append(LintingError(
                     id="invalid_docker_image_name",
                     severity=Severity.ERROR,
                     title=f'Invalid image name "{image_string}"',
                     message='Images must include an immutable digest: "<name>:<version-tag>@sha256:<64-hex>"',
-                    file=f"{app_id}/docker-compose.yml",
+                    file=compose_path,
                     properties_path=f"services.{service_name}.image"
                 ))
             else:
@@ -324,27 +544,48 @@ class DockerImageValidator:
                         severity=Severity.WARNING,
                         title=f'Invalid image tag "{image.tag}"',
                         message='Images should not use the "latest" tag',
-                        file=f"{app_id}/docker-compose.yml",
+                        file=compose_path,
                         properties_path=f"services.{service_name}.image"
                     ))
             
-            # Check architectures if requested
-            if check_architectures:
-                try:
-                    image_errors = await self.registry_client.validate_image(image)
-                    # Update file paths for the specific service
-                    for error in image_errors:
-                        error.file = f"{app_id}/docker-compose.yml"
-                        error.properties_path = f"services.{service_name}.image"
-                    errors.extend(image_errors)
-                except Exception as e:
-                    errors.append(LintingError(
-                        id="invalid_docker_image_name",
-                        severity=Severity.ERROR,
-                        title=f'Failed to validate image "{image_string}"',
-                        message=str(e),
-                        file=f"{app_id}/docker-compose.yml",
-                        properties_path=f"services.{service_name}.image"
-                    ))
+            # Queue architecture checks if requested. A malformed reference is
+            # already reported, so it is not worth a registry round trip.
+            if check_architectures and format_ok:
+                pending.append((service_name, image_string, image))
+        
+        if not pending:
+            return errors
+        
+        # Probe each distinct registry once up front; concurrent image checks
+        # against the same host would otherwise all miss the cache and probe it
+        await asyncio.gather(
+            *(self.registry_client.is_registry(host) for host in {image.api_host for _, _, image in pending})
+        )
+        
+        # Registry lookups are network-bound, so run them concurrently
+        results = await asyncio.gather(
+            *(self.registry_client.validate_image(image) for _, _, image in pending),
+            return_exceptions=True,
+        )
+        
+        for (service_name, image_string, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                errors.append(LintingError(
+                    id="invalid_docker_image_name",
+                    severity=Severity.ERROR,
+                    title=f'Failed to validate image "{image_string}"',
+                    message=str(result),
+                    file=compose_path,
+                    properties_path=f"services.{service_name}.image"
+                ))
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            
+            # Update file paths for the specific service
+            for error in result:
+                error.file = compose_path
+                error.properties_path = f"services.{service_name}.image"
+            errors.extend(result)
         
         return errors
@@ -7,12 +7,30 @@ and other GitHub-related resources.
 
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Any
 import httpx
 from urllib.parse import urlparse
 
 from ..core.models import LintingError, Severity
+from ..utils.http import request_with_retry
+
+# GitHub URL path patterns: /owner/repo/pull/number and /owner/repo
+_PR_PATH_RE = re.compile(r"^/[^/]+/[^/]+/pull/\d+/?$")
+_REPO_PATH_RE = re.compile(r"^/[^/]+/[^/]+/?$")
+
+
+def _norm_key(url: str) -> str:
+    """Normalize a GitHub URL for use as a cache key.
+    
+    Spellings of the same resource ("www." prefix, trailing slash, letter
+    case, which GitHub ignores in owner and repo names) map to one key so
+    they share a single existence check.
+    """
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").removeprefix("www.")
+    return parsed._replace(netloc=host, path=parsed.path.rstrip("/").lower()).geturl()
 
 
 class GitHubValidator:
@@ -21,7 +39,33 @@ class GitHubValidator:
     def __init__(self, timeout: float = 5.0):
         """Initialize the GitHub validator."""
         self.timeout = timeout
+        # Normalized URL -> whether the PR/repository exists
         self._cache: dict[str, bool] = {}
+        self._client: httpx.AsyncClient | None = None
+    
+    async def __aenter__(self) -> GitHubValidator:
+        """Enter the async context manager."""
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the shared HTTP client on exit."""
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(connect=2.0, read=self.timeout, write=2.0, pool=5.0),
+                follow_redirects=True,
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def validate_pull_request(self, pr_url: str, app_id: str) -> list[LintingError]:
         """
@@ -75,8 +119,7 @@ class GitHubValidator:
                 return False
             
             # Must match GitHub PR path pattern: /owner/repo/pull/number
-            path_pattern = r"^/[^/]+/[^/]+/pull/\d+/?$"
-            return bool(re.match(path_pattern, parsed.path))
+            return bool(_PR_PATH_RE.match(parsed.path))
             
         except Exception:
             return False
@@ -86,43 +129,44 @@ class GitHubValidator:
 
         Uses GitHub REST API if possible for reliable status; falls back to HTML.
         """
-        if pr_url in self._cache:
-            return self._cache[pr_url]
+        key = _norm_key(pr_url)
+        if key in self._cache:
+            return self._cache[key]
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                headers = {
-                    "User-Agent": "umbrel-linter/1.0",
-                    "Accept": "application/vnd.github.v3+json",
-                }
+            client = self._get_client()
+            headers = {
+                "User-Agent": "umbrel-linter/1.0",
+                "Accept": "application/vnd.github.v3+json",
+            }
 
-                owner, repo, number = self._parse_github_pr(pr_url)
-                exists = True
-                if owner and repo and number:
-                    api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}"
-                    resp = await client.get(api_url, headers=headers)
-                    if resp.status_code == 200:
-                        exists = True
-                    elif resp.status_code == 404:
-                        exists = False
-                    else:
-                        # On rate-limit or other statuses, do not block lint; assume exists
-                        exists = True
+            owner, repo, number = self._parse_github_pr(pr_url)
+            exists = True
+            if owner and repo and number:
+                api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls/{number}"
+                resp = await request_with_retry(client, "GET", api_url, headers=headers)
+                if resp.status_code == 200:
+                    exists = True
+                elif resp.status_code == 404:
+                    exists = False
+                else:
+                    # On rate-limit or other statuses, do not block lint; assume exists
+                    exists = True
+            else:
+                # Fallback to the HTML PR page; only its status is needed
+                resp = await request_with_retry(client, "HEAD", pr_url, headers={"User-Agent": "umbrel-linter/1.0"})
+                if resp.status_code == 200:
+                    exists = True
+                elif resp.status_code == 404:
+                    exists = False
                 else:
-                    # Fallback to fetching the HTML PR page
-                    resp = await client.get(pr_url, headers={"User-Agent": "umbrel-linter/1.0"})
-                    if resp.status_code == 200:
-                        exists = True
-                    elif resp.status_code == 404:
-                        exists = False
-                    else:
-                        exists = True
+                    exists = True
 
-                self._cache[pr_url] = exists
-                return exists
+            self._cache[key] = exists
+            return exists
         except Exception:
             # On any error, do not fail lint for existence check
-            self._cache[pr_url] = True
+            self._cache[key] = True
             return True
 
     def _parse_github_pr(self, url: str) -> tuple[str | None, str | None, str | None]:
@@ -148,18 +192,21 @@ class GitHubValidator:
             List of linting errors
         """
         errors = []
+        checks = []
         
         # Check submission URL (pull request)
         submission_url = manifest_data.get("submission")
         if submission_url:
-            pr_errors = await self.validate_pull_request(str(submission_url), app_id)
-            errors.extend(pr_errors)
+            checks.append(self.validate_pull_request(str(submission_url), app_id))
         
         # Check repo URL (if it's a GitHub URL)
         repo_url = manifest_data.get("repo")
         if repo_url and isinstance(repo_url, str) and repo_url.strip():
-            repo_errors = await self._validate_github_repo_url(str(repo_url), app_id)
-            errors.extend(repo_errors)
+            checks.append(self._validate_github_repo_url(str(repo_url), app_id))
+        
+        # The two checks hit different URLs, so run them concurrently
+        for check_errors in await asyncio.gather(*checks):
+            errors.extend(check_errors)
         
         return errors
     
@@ -206,33 +253,35 @@ class GitHubValidator:
                 return False
             
             # Must match GitHub repo path pattern: /owner/repo
-            path_pattern = r"^/[^/]+/[^/]+/?$"
-            return bool(re.match(path_pattern, parsed.path))
+            return bool(_REPO_PATH_RE.match(parsed.path))
             
         except Exception:
             return False
     
     async def _repo_exists(self, repo_url: str) -> bool:
         """Check if a GitHub repository exists and is accessible."""
-        if repo_url in self._cache:
-            return self._cache[repo_url]
+        key = _norm_key(repo_url)
+        if key in self._cache:
+            return self._cache[key]
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Add headers to avoid rate limiting
-                headers = {
-                    "User-Agent": "umbrel-linter/1.0",
-                    "Accept": "application/vnd.github.v3+json",
-                }
-                
-                response = await client.get(repo_url, headers=headers)
-                
-                # Repo exists if we get 200, 404 means it doesn't exist
-                exists = response.status_code == 200
-                self._cache[repo_url] = exists
-                return exists
-                
+            client = self._get_client()
+            # Add headers to avoid rate limiting
+            headers = {
+                "User-Agent": "umbrel-linter/1.0",
+                "Accept": "application/vnd.github.v3+json",
+            }
+            
+            # HEAD gives the same status as GET without downloading the page.
+            # Renamed/transferred repos redirect to their new location.
+            response = await request_with_retry(client, "HEAD", repo_url, headers=headers, follow_redirects=True)
+            
+            # Repo exists if we get 200, 404 means it doesn't exist
+            exists = response.status_code == 200
+            self._cache[key] = exists
+            return exists
+            
         except Exception:
             # If we can't check (network error, etc.), assume it exists to avoid false positives
-            self._cache[repo_url] = True
+            self._cache[key] = True
             return True
@@ -8,9 +8,44 @@ in Docker Compose files for proper validation.
 from __future__ import annotations
 
 import re
+import zlib
 from typing import Any
 
 
+# Matches both ${VAR} and $VAR patterns
+_VAR_RE = re.compile(r'\$(?:([a-zA-Z0-9_\-:]+)|\{([a-zA-Z0-9_\-:]+)\})')
+
+# (name fragment, mock value) pairs, checked in priority order. The first
+# fragment contained in the variable name wins. None means the mock is
+# generated per variable.
+_MOCK_RULES: tuple[tuple[str, str | None], ...] = (
+    ("_IP", "10.10.10.10"),
+    ("_PORT", None),
+    ("_PASS", "password"),
+    ("_USER", "username"),
+    ("_DIR", "/path/to/dir"),
+    ("_PATH", "/some/path"),
+    ("_SERVICE", "service"),
+    ("_SEED", "seed"),
+    ("_CONFIG", "/path/to/config"),
+    ("_MODE", "production"),
+    ("_NETWORK", "network"),
+    ("_DOMAIN", "domain.com"),
+    ("_NAME", "name"),
+    ("_VERSION", "1.0.0"),
+    ("_ROOT", "/path/to/root"),
+    ("_KEY", "key"),
+    ("_SECRET", "secret"),
+    ("_TOKEN", "token"),
+    ("_HOST", "host"),
+)
+_DEFAULT_MOCK = "mocked"
+
+# Range of mocked ports, above the privileged ones to make json schema happy
+_MIN_PORT = 1024
+_MAX_PORT = 65535
+
+
 class VariableMocker:
     """Mocks environment variables in Docker Compose files."""
     
@@ -28,81 +63,16 @@ class VariableMocker:
         Returns:
             Content with mocked variables
         """
-        variables = self._extract_variables(content)
-        mocked_variables = self._find_mocks(variables)
-        return self._replace_variables(content, mocked_variables)
-    
-    def _extract_variables(self, content: str) -> list[dict[str, str]]:
-        """Extract variables from content."""
-        # Match both ${VAR} and $VAR patterns
-        pattern = r'\$(?:([a-zA-Z0-9_\-:]+)|\{([a-zA-Z0-9_\-:]+)\})'
-        matches = re.findall(pattern, content)
-        
-        variables = []
-        for match in matches:
-            variable = match[0] if match[0] else match[1]
-            full_variable = f"${{{variable}}}" if "{" in content[content.find(f"${variable}"):content.find(f"${variable}") + len(f"${variable}") + 1] else f"${variable}"
-            
-            variables.append({
-                "full_variable": full_variable,
-                "variable": variable,
-                "mock": ""
-            })
-        
-        return variables
-    
-    def _find_mocks(self, variables: list[dict[str, str]]) -> list[dict[str, str]]:
-        """Find appropriate mock values for variables."""
-        for var in variables:
-            variable = var["variable"]
-            
-            if "_IP" in variable:
-                var["mock"] = "10.10.10.10"
-            elif "_PORT" in variable:
-                # Random port between 1024 and 65535 to make json schema happy
-                import random
-                var["mock"] = str(random.randint(1024, 65535))
-            elif "_PASS" in variable:
-                var["mock"] = "password"
-            elif "_USER" in variable:
-                var["mock"] = "username"
-            elif "_DIR" in variable:
-                var["mock"] = "/path/to/dir"
-            elif "_PATH" in variable:
-                var["mock"] = "/some/path"
-            elif "_SERVICE" in variable:
-                var["mock"] = "service"
-            elif "_SEED" in variable:
-                var["mock"] = "seed"
-            elif "_CONFIG" in variable:
-                var["mock"] = "/path/to/config"
-            elif "_MODE" in variable:
-                var["mock"] = "production"
-            elif "_NETWORK" in variable:
-                var["mock"] = "network"
-            elif "_DOMAIN" in variable:
-                var["mock"] = "domain.com"
-            elif "_NAME" in variable:
-                var["mock"] = "name"
-            elif "_VERSION" in variable:
-                var["mock"] = "1.0.0"
-            elif "_ROOT" in variable:
-                var["mock"] = "/path/to/root"
-            elif "_KEY" in variable:
-                var["mock"] = "key"
-            elif "_SECRET" in variable:
-                var["mock"] = "secret"
-            elif "_TOKEN" in variable:
-                var["mock"] = "token"
-            elif "_HOST" in variable:
-                var["mock"] = "host"
-            else:
-                var["mock"] = "mocked"
-        
-        return variables
+        # Single pass: every match is replaced as soon as it is found
+        return _VAR_RE.sub(lambda match: self._find_mock(match.group(1) or match.group(2)), content)
     
-    def _replace_variables(self, content: str, variables: list[dict[str, str]]) -> str:
-        """Replace variables with their mock values."""
-        for var in variables:
-            content = content.replace(var["full_variable"], var["mock"])
-        return content
+    def _find_mock(self, variable: str) -> str:
+        """Find an appropriate mock value for a variable."""
+        for fragment, mock in _MOCK_RULES:
+            if fragment in variable:
+                if mock is None:
+                    # Derived from the name, so the mock is the same on every
+                    # call and run, whatever order files are mocked in
+                    return str(_MIN_PORT + zlib.crc32(variable.encode()) % (_MAX_PORT - _MIN_PORT + 1))
+                return mock
+        return _DEFAULT_MOCK
@@ -7,27 +7,171 @@ source map information for error reporting.
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from contextlib import suppress
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import Any
 
 import yaml
 
 from ..core.models import ColumnRange, LineRange, LintingError, Severity
+from ..utils.filesystem import cache_dir, disk_cache_enabled
 
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def parse_yaml_with_error_handling(content: str, filename: str) -> tuple[dict[str, Any] | None, LintingError | None]:
+# Constructors for the errors reported by the validators below
+_MISSING_ERR = partial(LintingError, id="missing_required_field", severity=Severity.ERROR)
+_TYPE_ERR = partial(LintingError, id="invalid_type", severity=Severity.ERROR)
+_BOOL_ERR = partial(LintingError, id="invalid_yaml_boolean_value", severity=Severity.ERROR)
+
+# Results of validate_from_content, least recently used first
+_RESULT_CACHE_SIZE = 512
+_result_cache: OrderedDict[tuple[Any, ...], list[LintingError]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# Marks a field that is absent, as opposed to present with a None value
+_MISSING = object()
+
+# Start of a line that can begin a top-level mapping key
+_TOP_LEVEL_LINE_RE = re.compile(r"^[^\s#-]", re.MULTILINE)
+
+# Parsed YAML files kept on disk; the oldest ones beyond this are pruned
+_PARSED_CACHE_MAX_FILES = 2000
+
+
+@lru_cache(maxsize=2048)
+def _load_yaml(content: str) -> Any:
+    """Parse YAML content, memoized on the content itself."""
+    # Manifests are parsed more than once per run (e.g. again when collecting
+    # used ports). lru_cache is thread-safe, and syntax errors are not cached.
+    if not disk_cache_enabled():
+        return yaml.load(content, Loader=Loader)
+
+    cache_file = cache_dir() / "parsed-yaml" / f"{hashlib.sha256(content.encode()).hexdigest()}.json"
+    try:
+        # Loading JSON is much faster than parsing YAML, so unchanged files
+        # from an earlier run skip the YAML parser entirely
+        return json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        pass
+
+    data = yaml.load(content, Loader=Loader)
+    _store_parsed(cache_file, data)
+    return data
+
+
+def _store_parsed(cache_file: Path, data: Any) -> None:
+    """Save parsed YAML as JSON, if JSON can represent it exactly."""
+    try:
+        dumped = json.dumps(data)
+        # Dates, non-string keys, NaN etc. would not come back unchanged
+        if json.loads(dumped) != data:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        _prune_parsed_cache(cache_file.parent)
+        # A unique temporary file per writer, so that threads and processes
+        # storing the same content never write into each other's file
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_file.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as temp_file:
+            temp_file.write(dumped)
+        os.replace(temp_file.name, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+@lru_cache(maxsize=None)
+def _prune_parsed_cache(directory: Path) -> None:
+    """Delete the oldest parsed YAML files beyond the limit, once per process."""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith((".json", ".tmp")):
+            with suppress(OSError):
+                entries.append((entry.stat().st_mtime, entry.path))
+
+    entries.sort()
+    for _, path in entries[:max(len(entries) - _PARSED_CACHE_MAX_FILES, 0)]:
+        with suppress(OSError):
+            os.remove(path)
+
+
+def parse_yaml_header(content: str, max_bytes: int = 4096, required_fields: Iterable[str] = ()) -> Any:
+    """
+    Parse only the top-level keys at the start of a YAML mapping.
+    
+    The first max_bytes of the content are cut before the last top-level
+    key that starts in them, so every key returned has its complete value.
+    Keys further down the file are missing from the result.
+    
+    Args:
+        content: YAML content as string
+        max_bytes: Size of the leading part of the content to parse
+        required_fields: Keys the caller needs; if the header lacks any of
+            them, the whole content is parsed instead
+        
+    Returns:
+        Parsed data of the header, or of the whole content on fallback
+        
+    Raises:
+        yaml.YAMLError: If the whole content had to be parsed and is invalid
+    """
+    if len(content) > max_bytes:
+        header = content[:max_bytes]
+        cut = None
+        for cut in _TOP_LEVEL_LINE_RE.finditer(header):
+            pass
+        if cut is not None and cut.start() > 0:
+            try:
+                data = yaml.load(header[:cut.start()], Loader=Loader)
+            except yaml.YAMLError:
+                data = None
+            if isinstance(data, dict) and all(field in data for field in required_fields):
+                return data
+
+    return _load_yaml(content)
+
+
+def parse_yaml_with_error_handling(
+    content: str,
+    filename: str,
+    top_level_only: bool = False,
+    required_fields: Iterable[str] = (),
+) -> tuple[dict[str, Any] | None, LintingError | None]:
     """
     Parse YAML content with comprehensive error handling.
     
     Args:
         content: YAML content as string
         filename: Name of the file being parsed
+        top_level_only: Only parse the header of the file for callers that
+            just need some top-level keys (see parse_yaml_header)
+        required_fields: Top-level keys needed with top_level_only
         
     Returns:
         Tuple of (parsed_data, error). If parsing succeeds, error is None.
         If parsing fails, parsed_data is None and error contains details.
+        Parsed data is shared between calls with the same content and must
+        not be modified.
     """
     try:
-        data = yaml.safe_load(content)
+        if top_level_only:
+            data = parse_yaml_header(content, required_fields=required_fields)
+        else:
+            data = _load_yaml(content)
         return data, None
     except yaml.YAMLError as e:
         error = LintingError(
@@ -40,12 +184,49 @@ def parse_yaml_with_error_handling(content: str, filename: str) -> tuple[dict[st
         return None, error
 
 
+@lru_cache(maxsize=64)
+def _compose_yaml(content: str) -> yaml.Node | None:
+    """Compose YAML content into a node tree with source positions."""
+    try:
+        node: yaml.Node | None = yaml.compose(content, Loader=Loader)
+        return node
+    except yaml.YAMLError:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _split_lines(content: str) -> tuple[str, ...]:
+    """Split content into lines, memoized so repeated lookups split it once."""
+    return tuple(content.splitlines())
+
+
+def _find_node(root: yaml.Node | None, path: list[str]) -> yaml.Node | None:
+    """Find the node a path points at: the key node for mapping entries."""
+    node = root
+    target = None
+    for part in path:
+        if isinstance(node, yaml.MappingNode):
+            # Later duplicate keys win, as they do when loading
+            for key_node, value_node in reversed(node.value):
+                if isinstance(key_node, yaml.ScalarNode) and key_node.value == str(part):
+                    target, node = key_node, value_node
+                    break
+            else:
+                return None
+        elif isinstance(node, yaml.SequenceNode) and str(part).isdigit() and int(part) < len(node.value):
+            target = node = node.value[int(part)]
+        else:
+            return None
+    return target
+
+
 def get_source_map_for_path(content: str, path: list[str]) -> dict[str, LineRange | ColumnRange]:
     """
     Extract source map information for a given JSON path.
     
-    This is a simplified implementation. In a real implementation, you would
-    use a proper YAML parser with source map support like ruamel.yaml.
+    The path is resolved against the composed YAML node tree, which records
+    the position of every key. If the content does not parse, a line-based
+    search is used instead.
     
     Args:
         content: YAML content as string
@@ -54,24 +235,51 @@ def get_source_map_for_path(content: str, path: list[str]) -> dict[str, LineRang
     Returns:
         Dictionary with line and column information
     """
-    lines = content.split("\n")
-    result = {}
+    root = _compose_yaml(content)
+    if root is None:
+        return _scan_source_map(content, path)
+
+    node = _find_node(root, path) if path else None
+    if node is None:
+        return {}
+
+    mark = node.start_mark
+    return {
+        "line": LineRange(start=mark.line + 1, end=mark.line + 1),
+        "column": ColumnRange(start=mark.column + 1, end=mark.column + 1),
+    }
+
+
+def _scan_source_map(content: str, path: list[str]) -> dict[str, LineRange | ColumnRange]:
+    """Find the first line mentioning any part of a path (best effort)."""
+    result: dict[str, LineRange | ColumnRange] = {}
+    if not path:
+        return result
+
+    # One alternation finds any of the path parts in a single scan per line
+    pattern = re.compile("|".join(re.escape(str(part)) for part in path))
 
     # Simple line-based search for the property
-    for i, line in enumerate(lines):
-        if any(part in line for part in path):
+    for i, line in enumerate(_split_lines(content)):
+        if pattern.search(line):
             result["line"] = LineRange(start=i + 1, end=i + 1)
-            # Find column position (simplified)
-            for j, char in enumerate(line):
-                if char in [":", "="]:
-                    result["column"] = ColumnRange(start=j + 1, end=j + 1)
-                    break
+            # Find column position (simplified): the first ":" or "="
+            colon = line.find(":")
+            equals = line.find("=")
+            j = colon if equals < 0 else equals if colon < 0 else min(colon, equals)
+            if j >= 0:
+                result["column"] = ColumnRange(start=j + 1, end=j + 1)
             break
 
     return result
 
 
-def validate_yaml_structure(data: dict[str, Any], required_fields: list[str], filename: str) -> list[LintingError]:
+def validate_yaml_structure(
+    data: dict[str, Any],
+    required_fields: list[str],
+    filename: str,
+    out: list[LintingError] | None = None,
+) -> list[LintingError]:
     """
     Validate that required fields exist in the YAML data.
     
@@ -79,17 +287,18 @@ def validate_yaml_structure(data: dict[str, Any], required_fields: list[str], fi
         data: Parsed YAML data
         required_fields: List of required field names
         filename: Name of the file being validated
+        out: Optional list to append the errors to instead of a new one
         
     Returns:
-        List of linting errors for missing fields
+        List of linting errors for missing fields (out, if given)
     """
-    errors = []
+    # Errors for the same file, across calls, share one filename string
+    filename = sys.intern(filename)
+    errors = out if out is not None else []
 
     for field in required_fields:
         if field not in data:
-            errors.append(LintingError(
-                id="missing_required_field",
-                severity=Severity.ERROR,
+            errors.append(_MISSING_ERR(
                 title=f"Missing required field: {field}",
                 message=f"The '{field}' field is required in {filename}",
                 file=filename,
@@ -99,7 +308,18 @@ def validate_yaml_structure(data: dict[str, Any], required_fields: list[str], fi
     return errors
 
 
-def validate_yaml_types(data: dict[str, Any], type_mapping: dict[str, type], filename: str) -> list[LintingError]:
+@lru_cache(maxsize=64)
+def _type_checks(type_items: tuple[tuple[str, type], ...]) -> tuple[tuple[str, type, str], ...]:
+    """Get (field, expected_type, type_name) checks for a type mapping."""
+    return tuple((field, expected_type, expected_type.__name__) for field, expected_type in type_items)
+
+
+def validate_yaml_types(
+    data: dict[str, Any],
+    type_mapping: dict[str, type],
+    filename: str,
+    out: list[LintingError] | None = None,
+) -> list[LintingError]:
     """
     Validate that fields have the correct types.
     
@@ -107,60 +327,156 @@ def validate_yaml_types(data: dict[str, Any], type_mapping: dict[str, type], fil
         data: Parsed YAML data
         type_mapping: Dictionary mapping field names to expected types
         filename: Name of the file being validated
+        out: Optional list to append the errors to instead of a new one
         
     Returns:
-        List of linting errors for type mismatches
-    """
-    errors = []
-
-    for field, expected_type in type_mapping.items():
-        if field in data:
-            value = data[field]
-            if not isinstance(value, expected_type):
-                errors.append(LintingError(
-                    id="invalid_type",
-                    severity=Severity.ERROR,
-                    title=f"Invalid type for field: {field}",
-                    message=f"Expected {expected_type.__name__}, got {type(value).__name__}",
-                    file=filename,
-                    properties_path=field,
-                ))
+        List of linting errors for type mismatches (out, if given)
+    """
+    filename = sys.intern(filename)
+    errors = out if out is not None else []
+    append = errors.append
+
+    for field, expected_type, expected_name in _type_checks(tuple(type_mapping.items())):
+        value = data.get(field, _MISSING)
+        if value is not _MISSING and not isinstance(value, expected_type):
+            append(_TYPE_ERR(
+                title=f"Invalid type for field: {field}",
+                message=f"Expected {expected_name}, got {type(value).__name__}",
+                file=filename,
+                properties_path=field,
+            ))
 
     return errors
 
 
-def validate_boolean_strings(data: dict[str, Any], filename: str) -> list[LintingError]:
+def validate_boolean_strings(
+    data: dict[str, Any],
+    filename: str,
+    out: list[LintingError] | None = None,
+) -> list[LintingError]:
     """
     Validate that boolean values are strings (for Docker Compose V1 compatibility).
     
     Args:
         data: Parsed YAML data
         filename: Name of the file being validated
+        out: Optional list to append the errors to instead of a new one
         
     Returns:
-        List of linting errors for boolean type issues
-    """
-    errors = []
-
-    def check_dict(d: dict[str, Any], path: str = "") -> None:
-        for key, value in d.items():
-            current_path = f"{path}.{key}" if path else key
-
-            if isinstance(value, dict):
-                check_dict(value, current_path)
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        check_dict(item, f"{current_path}[{i}]")
-            elif isinstance(value, bool):
-                errors.append(LintingError(
-                    id="invalid_yaml_boolean_value",
-                    severity=Severity.ERROR,
-                    title=f"Invalid YAML boolean value for key '{key}'",
-                    message=f"Boolean values should be strings like '{str(value).lower()}' instead of {value}",
-                    file=filename,
-                    properties_path=current_path,
-                ))
-
-    check_dict(data)
+        List of linting errors for boolean type issues (out, if given)
+    """
+    filename = sys.intern(filename)
+    errors = out if out is not None else []
+    append = errors.append
+
+    # Depth-first walk with an explicit stack of (key, value, path) entries.
+    # Children are pushed in reverse so errors come out in document order.
+    # Paths are (parent_path, part) links, joined only when reporting an error.
+    stack: list[tuple[Any, Any, tuple[Any, Any]]] = [
+        (key, value, (None, key)) for key, value in reversed(data.items())
+    ]
+    while stack:
+        key, value, path = stack.pop()
+
+        # Parsed YAML only holds plain builtins, so exact type checks suffice
+        value_type = type(value)
+        if value_type is dict:
+            for child_key, child in reversed(value.items()):
+                stack.append((child_key, child, (path, child_key)))
+        elif value_type is list:
+            parent, part = path
+            for i in range(len(value) - 1, -1, -1):
+                item = value[i]
+                if type(item) is dict:
+                    item_path = (parent, f"{part}[{i}]")
+                    for child_key, child in reversed(item.items()):
+                        stack.append((child_key, child, (item_path, child_key)))
+        elif value_type is bool:
+            append(_BOOL_ERR(
+                title=f"Invalid YAML boolean value for key '{key}'",
+                message=f"Boolean values should be strings like '{str(value).lower()}' instead of {value}",
+                file=filename,
+                properties_path=sys.intern(_join_path(path)),
+            ))
+
     return errors
+
+
+def _join_path(path: tuple[Any, Any] | None) -> str:
+    """Join a linked (parent_path, part) path into a dotted string."""
+    parts: list[str] = []
+    while path is not None:
+        path, part = path
+        parts.append(str(part))
+    return ".".join(reversed(parts))
+
+
+def lint_yaml(
+    content: str,
+    required_fields: list[str],
+    type_mapping: dict[str, type],
+    filename: str,
+) -> tuple[Any, list[LintingError]]:
+    """
+    Parse YAML content and run all checks of this module on it.
+    
+    Args:
+        content: YAML content as string
+        required_fields: List of required field names
+        type_mapping: Dictionary mapping field names to expected types
+        filename: Name of the file being validated
+        
+    Returns:
+        Tuple of (parsed_data, errors). If parsing fails, parsed_data is
+        None and errors only holds the syntax error.
+    """
+    filename = sys.intern(filename)
+    data, error = parse_yaml_with_error_handling(content, filename)
+    if error is not None:
+        return None, [error]
+    if not isinstance(data, dict):
+        # Field checks only apply to a top-level mapping
+        return data, []
+
+    errors = validate_yaml_structure(data, required_fields, filename)
+    validate_yaml_types(data, type_mapping, filename, out=errors)
+    validate_boolean_strings(data, filename, out=errors)
+    return data, errors
+
+
+def validate_from_content(
+    content: str,
+    required_fields: list[str],
+    type_mapping: dict[str, type],
+    filename: str,
+) -> list[LintingError]:
+    """
+    Validate YAML content, reusing the result for content seen before.
+    
+    Meant for long-running callers (editors, watchers) that validate the
+    same file again and again while it is unchanged.
+    
+    Args:
+        content: YAML content as string
+        required_fields: List of required field names
+        type_mapping: Dictionary mapping field names to expected types
+        filename: Name of the file being validated
+        
+    Returns:
+        List of linting errors, as lint_yaml reports them
+    """
+    key = (content, filename, tuple(required_fields), tuple(type_mapping.items()))
+    with _result_cache_lock:
+        errors = _result_cache.get(key)
+        if errors is not None:
+            _result_cache.move_to_end(key)
+
+    if errors is None:
+        _, errors = lint_yaml(content, required_fields, type_mapping, filename)
+        with _result_cache_lock:
+            _result_cache[key] = errors
+            if len(_result_cache) > _RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+
+    # Callers may update errors in place, so never hand out the cached ones
+    return [error.model_copy() for error in errors]